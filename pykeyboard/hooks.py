@@ -236,7 +236,7 @@ class ButtonValidator:
             **(context or {}),
             "keyboard_type": type(keyboard).__name__,
             "total_rows": len(keyboard.keyboard),
-            "total_buttons": sum(len(row) for row in keyboard.keyboard),
+            "total_buttons": keyboard.total_buttons,
         }
 
         context_errors = []
@@ -250,7 +250,11 @@ class ButtonValidator:
         button_results = []
         valid_buttons = 0
         total_buttons = 0
+        all_errors = []
+        all_warnings = []
+        all_suggestions = []
 
+        # Single pass: aggregate each button's findings as it is validated
         for row_idx, row in enumerate(keyboard.keyboard):
             for btn_idx, button in enumerate(row):
                 total_buttons += 1
@@ -267,15 +271,9 @@ class ButtonValidator:
                 )
                 if result["is_valid"]:
                     valid_buttons += 1
-
-        all_errors = []
-        all_warnings = []
-        all_suggestions = []
-
-        for result in button_results:
-            all_errors.extend(result["result"]["errors"])
-            all_warnings.extend(result["result"]["warnings"])
-            all_suggestions.extend(result["result"]["suggestions"])
+                all_errors.extend(result["errors"])
+                all_warnings.extend(result["warnings"])
+                all_suggestions.extend(result["suggestions"])
 
         all_errors.extend(context_errors)
 
@@ -9,8 +9,10 @@
 
 import contextvars
 import hashlib
+import re
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import logging
 from pydantic import Field, PrivateAttr, model_validator
@@ -26,8 +28,36 @@ pagination_client_context: contextvars.ContextVar[Optional[str]] = (
 
 logger = logging.getLogger("pykeyboard.inline_keyboard")
 
-# Storage for pagination hashes
-_pagination_hashes: Dict[str, str] = {}
+# Storage for pagination hashes, kept in least-recently-used order and capped
+# so that bots which keep creating new sources don't grow it without bound.
+_MAX_PAGINATION_SOURCES = 10000
+_pagination_hashes: "OrderedDict[str, str]" = OrderedDict()
+
+
+# Callback patterns of the form "<prefix>{number}<suffix>", e.g. "page_{number}"
+_SIMPLE_NUMBER_PATTERN = re.compile(r"([^{}]*)\{number\}([^{}]*)")
+
+
+@lru_cache(maxsize=128)
+def _compile_callback_pattern(callback_pattern: str) -> Callable[[int], str]:
+    """Compile a pagination callback pattern into a page-number renderer.
+
+    Patterns with a single bare ``{number}`` field are rendered by plain
+    concatenation, skipping ``str.format`` parsing on every button. Any
+    other pattern falls back to ``str.format``.
+
+    Args:
+        callback_pattern: Pattern containing a ``{number}`` placeholder.
+
+    Returns:
+        Callable[[int], str]: Function returning the callback data for a page.
+    """
+    match = _SIMPLE_NUMBER_PATTERN.fullmatch(callback_pattern)
+    if match is None:
+        return lambda number: callback_pattern.format(number=number)
+
+    prefix, suffix = match.groups()
+    return lambda number: f"{prefix}{number}{suffix}"
 
 
 def reset_pagination_client_context() -> None:
@@ -160,9 +190,8 @@ class InlineKeyboard(KeyboardBase):
     @model_validator(mode="after")
     def initialize_pyrogram_markup(self) -> "InlineKeyboard":
         """Initialize the Pyrogram InlineKeyboardMarkup after model creation."""
-        self._pyrogram_markup = InlineKeyboardMarkup(
-            inline_keyboard=self.keyboard
-        )
+        self._pyrogram_markup = InlineKeyboardMarkup(inline_keyboard=[])
+        self._update_keyboard()
         return self
 
     @property
@@ -171,19 +200,25 @@ class InlineKeyboard(KeyboardBase):
         return self._pyrogram_markup
 
     def _update_keyboard(self) -> None:
-        """Update the underlying Pyrogram InlineKeyboardMarkup."""
+        """Update the underlying Pyrogram InlineKeyboardMarkup.
+
+        All rows are rebuilt, so edits made directly to ``keyboard`` or to
+        its buttons are picked up. The markup owns its row list and updates
+        it in place, so references to the markup obtained earlier stay
+        current.
+        """
         super()._update_keyboard()
-        if self._pyrogram_markup:
-            pyrogram_keyboard = []
-            for row in self.keyboard:
-                pyrogram_row = []
-                for button in row:
-                    if isinstance(button, InlineButton):
-                        pyrogram_row.append(button.to_pyrogram())
-                    else:
-                        pyrogram_row.append(button)
-                pyrogram_keyboard.append(pyrogram_row)
-            self._pyrogram_markup.inline_keyboard = pyrogram_keyboard
+        self._pyrogram_markup.inline_keyboard[:] = [
+            [
+                (
+                    button.to_pyrogram()
+                    if isinstance(button, InlineButton)
+                    else button
+                )
+                for button in row
+            ]
+            for row in self.keyboard
+        ]
 
     @staticmethod
     @lru_cache(maxsize=512)
@@ -280,10 +315,15 @@ class InlineKeyboard(KeyboardBase):
         # Check for duplicates
         if source in _pagination_hashes:
             if current_hash == _pagination_hashes[source]:
+                # A duplicate hit is still a use of the source
+                _pagination_hashes.move_to_end(source)
                 raise PaginationUnchangedError(source)
 
         # Store hash for future duplicate detection
         _pagination_hashes[source] = current_hash
+        _pagination_hashes.move_to_end(source)
+        if len(_pagination_hashes) > _MAX_PAGINATION_SOURCES:
+            _pagination_hashes.popitem(last=False)
 
         self.count_pages = count_pages
         self.current_page = current_page
@@ -295,6 +335,7 @@ class InlineKeyboard(KeyboardBase):
             pagination = self._build_large_pagination()
 
         self.keyboard.append(pagination)
+        self._update_keyboard()
 
     def _build_small_pagination(self) -> List[InlineKeyboardButton]:
         """Build pagination for small number of pages (≤5).
@@ -312,6 +353,7 @@ class InlineKeyboard(KeyboardBase):
             For 3 pages, current page 2:
             ['1', '· 2 ·', '3']
         """
+        render_callback = _compile_callback_pattern(self.callback_pattern)
         return [
             self._create_button(
                 text=(
@@ -319,7 +361,7 @@ class InlineKeyboard(KeyboardBase):
                     if i == self.current_page
                     else str(i)
                 ),
-                callback_data=self.callback_pattern.format(number=i),
+                callback_data=render_callback(i),
             )
             for i in range(1, self.count_pages + 1)
         ]
@@ -347,6 +389,7 @@ class InlineKeyboard(KeyboardBase):
             For 10 pages, current page 2:
             ['1', '· 2 ·', '3', '4 ›', '10 »']
         """
+        render_callback = _compile_callback_pattern(self.callback_pattern)
         buttons = []
         for i in range(1, 6):
             if i == self.current_page:
@@ -361,7 +404,7 @@ class InlineKeyboard(KeyboardBase):
             buttons.append(
                 self._create_button(
                     text=text,
-                    callback_data=self.callback_pattern.format(number=i),
+                    callback_data=render_callback(i),
                 )
             )
         return buttons
@@ -382,40 +425,33 @@ class InlineKeyboard(KeyboardBase):
             For 10 pages, current page 5:
             ['« 1', '‹ 4', '· 5 ·', '6 ›', '10 »']
         """
+        render_callback = _compile_callback_pattern(self.callback_pattern)
         return [
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["first"].format(1),
-                callback_data=self.callback_pattern.format(number=1),
+                callback_data=render_callback(1),
             ),
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["prev"].format(
                     self.current_page - 1
                 ),
-                callback_data=self.callback_pattern.format(
-                    number=self.current_page - 1
-                ),
+                callback_data=render_callback(self.current_page - 1),
             ),
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["current"].format(
                     self.current_page
                 ),
-                callback_data=self.callback_pattern.format(
-                    number=self.current_page
-                ),
+                callback_data=render_callback(self.current_page),
             ),
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["next"].format(
                     self.current_page + 1
                 ),
-                callback_data=self.callback_pattern.format(
-                    number=self.current_page + 1
-                ),
+                callback_data=render_callback(self.current_page + 1),
             ),
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["last"].format(self.count_pages),
-                callback_data=self.callback_pattern.format(
-                    number=self.count_pages
-                ),
+                callback_data=render_callback(self.count_pages),
             ),
         ]
 
@@ -435,18 +471,17 @@ class InlineKeyboard(KeyboardBase):
             For 10 pages, current page 9:
             ['« 1', '‹ 7', '8', '· 9 ·', '10']
         """
+        render_callback = _compile_callback_pattern(self.callback_pattern)
         buttons = [
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["first"].format(1),
-                callback_data=self.callback_pattern.format(number=1),
+                callback_data=render_callback(1),
             ),
             self._create_button(
                 text=self.PAGINATION_SYMBOLS["prev"].format(
                     self.count_pages - 3
                 ),
-                callback_data=self.callback_pattern.format(
-                    number=self.count_pages - 3
-                ),
+                callback_data=render_callback(self.count_pages - 3),
             ),
         ]
 
@@ -459,7 +494,7 @@ class InlineKeyboard(KeyboardBase):
             buttons.append(
                 self._create_button(
                     text=text,
-                    callback_data=self.callback_pattern.format(number=i),
+                    callback_data=render_callback(i),
                 )
             )
         return buttons
@@ -502,25 +537,31 @@ class InlineKeyboard(KeyboardBase):
         if not locales:
             raise LocaleError("locales", reason="locales list cannot be empty")
 
-        all_locales = self.get_all_locales()
-        valid_locales = [locale for locale in locales if locale in all_locales]
+        # Resolve against both dictionaries directly instead of merging them
+        # into a fresh dict on every call.
+        builtin_locales = self._get_locales()
+        custom_locales = self.custom_locales
+        buttons = [
+            self._create_button(
+                text=(
+                    custom_locales[locale]
+                    if locale in custom_locales
+                    else builtin_locales[locale]
+                ),
+                callback_data=callback_pattern.format(locale=locale),
+            )
+            for locale in locales
+            if locale in custom_locales or locale in builtin_locales
+        ]
 
-        if not valid_locales:
-            available_locales = list(all_locales.keys())[:5]
+        if not buttons:
+            available_locales = list(self.get_all_locales())[:5]
 
             raise LocaleError(
                 "locales",
                 reason=f"No valid locales found. Available locales include: {available_locales}",
             )
 
-        buttons = [
-            self._create_button(
-                text=all_locales[locale],
-                callback_data=callback_pattern.format(locale=locale),
-            )
-            for locale in valid_locales
-        ]
-
         self.keyboard = [
             buttons[i : i + row_width]
             for i in range(0, len(buttons), row_width)
@@ -531,7 +572,7 @@ class InlineKeyboard(KeyboardBase):
 
     def write(self, client: Any = None) -> Any:
         """Pyrogram serialization hook to allow passing this object directly as reply_markup."""
-        return self._pyrogram_markup.write(client)
+        return self.pyrogram_markup.write(client)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert keyboard to dictionary representation for serialization."""
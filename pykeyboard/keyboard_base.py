@@ -7,6 +7,7 @@
 #
 # pykeyboard/keyboard_base.py
 import logging
+import warnings
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
@@ -50,6 +51,17 @@ class KeyboardBase(BaseModel):
         )
     )
 
+    @property
+    def total_buttons(self) -> int:
+        """Total number of buttons across all rows.
+
+        Computed on access rather than tracked incrementally, because
+        ``keyboard`` is a public list that callers may modify directly.
+
+        Time complexity: O(r) where r is the number of rows.
+        """
+        return sum(map(len, self.keyboard))
+
     def add(self, *args: Any) -> "KeyboardBase":
         """Add buttons to keyboard in rows based on row_width.
 
@@ -72,12 +84,11 @@ class KeyboardBase(BaseModel):
             >>> keyboard.keyboard
             [['A', 'B'], ['C', 'D'], ['E']]
         """
-        
-        for i in range(0, len(args), self.row_width):
-            row_slice = args[i : i + self.row_width]
-            self.keyboard.append(
-                list(row_slice)
-            )  # Only convert slice to list once
+        row_width = self.row_width
+        self.keyboard.extend(
+            list(args[i : i + row_width])
+            for i in range(0, len(args), row_width)
+        )
         self._update_keyboard()
         return self
 
@@ -223,8 +234,6 @@ class InlineButton(Button):
             DeprecationWarning: When using positional arguments
             ValueError: If positional arguments are invalid
         """
-        import warnings
-
         if args:
             # Handle positional arguments (deprecated)
             warnings.warn(
@@ -7,6 +7,7 @@
 #
 # pykeyboard/reply_keyboard.py
 import logging
+import warnings
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
@@ -185,8 +186,6 @@ class ReplyButton(Button):
             DeprecationWarning: When using positional arguments
             ValueError: If positional arguments are invalid
         """
-        import warnings
-
         if args:
             warnings.warn(
                 "Positional arguments for ReplyButton are deprecated. "
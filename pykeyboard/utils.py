@@ -8,7 +8,12 @@
 # pykeyboard/utils.py
 
 import logging
-from typing import Any, Dict, List, Union
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional, Type, Union
+
+from pydantic import Strict, StrictStr, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from pydantic.functional_validators import AfterValidator, PlainValidator
+from typing_extensions import TypedDict
 
 from .inline_keyboard import InlineKeyboard
 from .keyboard_base import InlineButton
@@ -17,6 +22,80 @@ from .reply_keyboard import ReplyButton, ReplyKeyboard
 logger = logging.getLogger("pykeyboard.utils")
 
 
+_KEYBOARD_FACTORIES: Dict[str, Type[Union[InlineKeyboard, ReplyKeyboard]]] = {
+    "inline": InlineKeyboard,
+    "reply": ReplyKeyboard,
+}
+
+_BUTTON_CLASSES: Dict[str, Type[Union[InlineButton, ReplyButton]]] = {
+    "inline": InlineButton,
+    "reply": ReplyButton,
+}
+
+_KEYBOARD_TYPES: FrozenSet[str] = frozenset(_KEYBOARD_FACTORIES)
+
+
+def _check_keyboard_type(value: str) -> str:
+    """Accept keyboard types case-insensitively, like create_keyboard_from_config."""
+    if value.lower() not in _KEYBOARD_TYPES:
+        raise ValueError("unsupported keyboard type")
+    return value
+
+
+def _check_row_width(value: Any) -> int:
+    """Accept any int >= 1 without coercion; bools pass, as on the model field."""
+    if not isinstance(value, int) or value < 1:
+        raise ValueError("row_width must be a positive integer")
+    return value
+
+
+class KeyboardConfig(TypedDict, total=False):
+    """Schema of the configuration accepted by :func:`create_keyboard_from_config`."""
+
+    type: Annotated[StrictStr, AfterValidator(_check_keyboard_type)]
+    row_width: Annotated[int, PlainValidator(_check_row_width)]
+    buttons: Annotated[List[Any], Strict()]
+
+
+# Built once at import; validation then runs entirely inside pydantic-core.
+_CONFIG_VALIDATOR = TypeAdapter(KeyboardConfig)
+
+
+_CONFIG_ERROR_MESSAGES: Dict[str, str] = {
+    "row_width": "row_width must be a positive integer",
+    "buttons": "buttons must be a list",
+}
+
+
+class KeyboardInfo(TypedDict):
+    """Fields returned by :func:`get_keyboard_info` for every keyboard."""
+
+    type: str
+    row_width: int
+    total_buttons: int
+    total_rows: int
+
+
+class InlineKeyboardInfo(KeyboardInfo):
+    """Fields returned by :func:`get_keyboard_info` for an InlineKeyboard."""
+
+    has_pagination: bool
+    current_page: int
+    total_pages: int
+    callback_pattern: str
+    custom_locales_count: int
+
+
+class ReplyKeyboardInfo(KeyboardInfo):
+    """Fields returned by :func:`get_keyboard_info` for a ReplyKeyboard."""
+
+    is_persistent: Optional[bool]
+    resize_keyboard: Optional[bool]
+    one_time_keyboard: Optional[bool]
+    selective: Optional[bool]
+    placeholder: Optional[str]
+
+
 def create_keyboard_from_config(
     config: Dict[str, Any],
 ) -> Union[InlineKeyboard, ReplyKeyboard]:
@@ -48,33 +127,24 @@ def create_keyboard_from_config(
         keyboard = create_keyboard_from_config(config)
     """
     keyboard_type = config.get("type", "inline").lower()
-
-    if keyboard_type == "inline":
-        keyboard = InlineKeyboard()
-    elif keyboard_type == "reply":
-        keyboard = ReplyKeyboard()
-    else:
+    keyboard_cls = _KEYBOARD_FACTORIES.get(keyboard_type)
+    if keyboard_cls is None:
         raise ValueError(f"Unsupported keyboard type: {keyboard_type}")
 
+    keyboard = keyboard_cls()
+
     if "row_width" in config:
         keyboard.row_width = config["row_width"]
 
-    buttons = config.get("buttons", [])
-    button_objects = []
-
-    for button_config in buttons:
-        if isinstance(button_config, dict):
-            if keyboard_type == "inline":
-                button = InlineButton(**button_config)
-            else:
-                button = ReplyButton(**button_config)
-        else:
-            if keyboard_type == "inline":
-                button = InlineButton(text=str(button_config))
-            else:
-                button = ReplyButton(text=str(button_config))
-
-        button_objects.append(button)
+    button_cls = _BUTTON_CLASSES[keyboard_type]
+    button_objects = [
+        (
+            button_cls(**button_config)
+            if isinstance(button_config, dict)
+            else button_cls(text=str(button_config))
+        )
+        for button_config in config.get("buttons", [])
+    ]
 
     keyboard.add(*button_objects)
     return keyboard
@@ -82,44 +152,45 @@ def create_keyboard_from_config(
 
 def get_keyboard_info(
     keyboard: Union[InlineKeyboard, ReplyKeyboard],
-) -> Dict[str, Any]:
+) -> Union[InlineKeyboardInfo, ReplyKeyboardInfo, KeyboardInfo]:
     """Get comprehensive information about a keyboard.
 
     Args:
         keyboard: The keyboard to analyze.
 
     Returns:
-        Dictionary with keyboard metadata and statistics.
+        Plain dictionary with keyboard metadata and statistics, typed as
+        :class:`InlineKeyboardInfo`, :class:`ReplyKeyboardInfo`, or
+        :class:`KeyboardInfo` for other keyboard types.
     """
-    info: Dict[str, Any] = {
+    common: KeyboardInfo = {
         "type": type(keyboard).__name__,
         "row_width": keyboard.row_width,
-        "total_buttons": sum(len(row) for row in keyboard.keyboard),
+        "total_buttons": keyboard.total_buttons,
         "total_rows": len(keyboard.keyboard),
     }
 
     if isinstance(keyboard, InlineKeyboard):
-        info.update(
-            {
-                "has_pagination": keyboard.count_pages > 0,
-                "current_page": keyboard.current_page,
-                "total_pages": keyboard.count_pages,
-                "callback_pattern": keyboard.callback_pattern,
-                "custom_locales_count": len(keyboard.custom_locales),
-            }
-        )
-    elif isinstance(keyboard, ReplyKeyboard):
-        info.update(
-            {
-                "is_persistent": keyboard.is_persistent,
-                "resize_keyboard": keyboard.resize_keyboard,
-                "one_time_keyboard": keyboard.one_time_keyboard,
-                "selective": keyboard.selective,
-                "placeholder": keyboard.placeholder,
-            }
-        )
+        return {
+            **common,
+            "has_pagination": keyboard.count_pages > 0,
+            "current_page": keyboard.current_page,
+            "total_pages": keyboard.count_pages,
+            "callback_pattern": keyboard.callback_pattern,
+            "custom_locales_count": len(keyboard.custom_locales),
+        }
 
-    return info
+    if isinstance(keyboard, ReplyKeyboard):
+        return {
+            **common,
+            "is_persistent": keyboard.is_persistent,
+            "resize_keyboard": keyboard.resize_keyboard,
+            "one_time_keyboard": keyboard.one_time_keyboard,
+            "selective": keyboard.selective,
+            "placeholder": keyboard.placeholder,
+        }
+
+    return common
 
 
 def validate_keyboard_config(config: Dict[str, Any]) -> List[str]:
@@ -131,17 +202,40 @@ def validate_keyboard_config(config: Dict[str, Any]) -> List[str]:
     Returns:
         List of validation error messages (empty if valid).
     """
-    errors: List[str] = []
+    if _is_plainly_valid_config(config):
+        return []
 
-    if "type" in config and config["type"] not in ("inline", "reply"):
-        errors.append(f"Invalid keyboard type: {config['type']}")
+    try:
+        _CONFIG_VALIDATOR.validate_python(config)
+    except PydanticValidationError as exc:
+        return [_format_config_error(config, error) for error in exc.errors()]
+    return []
 
-    if "row_width" in config:
-        width = config["row_width"]
-        if not isinstance(width, int) or width < 1:
-            errors.append("row_width must be a positive integer")
 
-    if "buttons" in config and not isinstance(config["buttons"], list):
-        errors.append("buttons must be a list")
+def _is_plainly_valid_config(config: Any) -> bool:
+    """Cheap pre-check for the common, well-formed config shape.
 
-    return errors
+    Mirrors :class:`KeyboardConfig` with exact type checks, so it only
+    returns True for configs the schema accepts as well. Anything else
+    goes through the full validator for error reporting.
+    """
+    if type(config) is not dict:
+        return False
+
+    keyboard_type = config.get("type", "inline")
+    row_width = config.get("row_width", 1)
+    return (
+        type(keyboard_type) is str
+        and keyboard_type.lower() in _KEYBOARD_TYPES
+        and isinstance(row_width, int)
+        and row_width >= 1
+        and type(config.get("buttons", [])) is list
+    )
+
+
+def _format_config_error(config: Any, error: Dict[str, Any]) -> str:
+    """Translate a pydantic error into the validator's message format."""
+    field = error["loc"][0] if error["loc"] else None
+    if field == "type":
+        return f"Invalid keyboard type: {config['type']}"
+    return _CONFIG_ERROR_MESSAGES.get(field, error["msg"])
@@ -1,6 +1,7 @@
 """Tests for inline keyboard functionality."""
 
 import pytest
+from pyrogram.types import InlineKeyboardButton
 
 from pykeyboard import (InlineButton, InlineKeyboard, LocaleError,
                         PaginationError, PaginationUnchangedError,
@@ -61,6 +62,22 @@ class TestInlineKeyboard:
         ):
             keyboard.paginate(5, 10, "page_{number}")
 
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("page_{number}", ["page_1", "page_2", "page_3"]),
+            ("{number}", ["1", "2", "3"]),
+            ("{number}-{number}", ["1-1", "2-2", "3-3"]),
+            ("{{x}}:{number}", ["{x}:1", "{x}:2", "{x}:3"]),
+        ],
+    )
+    def test_pagination_callback_patterns(self, pattern, expected):
+        """Test callback data rendering for simple and formatted patterns."""
+        keyboard = InlineKeyboard()
+        keyboard.paginate(3, 1, pattern, source=f"patterns_{pattern}")
+
+        assert [b.callback_data for b in keyboard.keyboard[0]] == expected
+
     def test_language_selection_valid_locale(self):
         """Test language selection with valid locale."""
         keyboard = InlineKeyboard()
@@ -226,6 +243,47 @@ class TestInlineKeyboard:
         assert markup is not None
         assert len(markup.inline_keyboard) == 1
 
+    def test_pyrogram_markup_reference_stays_current(self):
+        """Test that markup obtained before add() holds converted buttons."""
+        keyboard = InlineKeyboard()
+        markup = keyboard.pyrogram_markup
+
+        keyboard.add(InlineButton(text="a", callback_data="a"))
+        keyboard.row(InlineButton(text="b", callback_data="b"))
+
+        assert markup.inline_keyboard is not keyboard.keyboard
+        assert len(markup.inline_keyboard) == 2
+        assert isinstance(markup.inline_keyboard[0][0], InlineKeyboardButton)
+        assert markup.inline_keyboard[1][0].callback_data == "b"
+
+    def test_pyrogram_markup_picks_up_direct_edits(self):
+        """Test that edits to existing rows and buttons reach the markup."""
+        keyboard = InlineKeyboard(row_width=2)
+        button = InlineButton(text="old", callback_data="b")
+        keyboard.add(InlineButton(text="a", callback_data="a"), button)
+        markup = keyboard.pyrogram_markup
+
+        keyboard.keyboard[0][0] = InlineButton(text="X", callback_data="x")
+        button.text = "new"
+        keyboard.add(InlineButton(text="c", callback_data="c"))
+
+        assert [b.text for b in markup.inline_keyboard[0]] == ["X", "new"]
+        assert markup.inline_keyboard[1][0].text == "c"
+
+    def test_pyrogram_markup_reflects_later_changes(self):
+        """Test that the markup is kept in sync after modifications."""
+        keyboard = InlineKeyboard()
+        keyboard.add(InlineButton(text="Test", callback_data="test"))
+        first = keyboard.pyrogram_markup.inline_keyboard
+
+        assert keyboard.pyrogram_markup.inline_keyboard is first
+
+        keyboard.paginate(3, 1, "markup_page_{number}", source="markup_test")
+        markup = keyboard.pyrogram_markup
+
+        assert len(markup.inline_keyboard) == 2
+        assert markup.inline_keyboard[1][0].callback_data == "markup_page_1"
+
     def test_serialization(self):
         """Test keyboard serialization and deserialization."""
         keyboard = InlineKeyboard()
@@ -376,6 +434,16 @@ class TestInlineKeyboard:
         assert keyboard.keyboard[0][0].text == "🏴‍☠️ Pirate English"
         assert keyboard.keyboard[1][0].text == "🇲🇽 Español Latino"
 
+    def test_custom_locale_overrides_builtin_in_languages(self):
+        """Test that custom locales take precedence in language selection."""
+        keyboard = InlineKeyboard()
+        keyboard.add_custom_locale("en_US", "🦅 American")
+
+        keyboard.languages("lang_{locale}", ["en_US", "ru_RU"], 2)
+
+        assert keyboard.keyboard[0][0].text == "🦅 American"
+        assert keyboard.keyboard[0][1].text == "🇷🇺 Русский"
+
     def test_custom_locale_removal(self):
         """Test custom locale removal."""
         keyboard = InlineKeyboard()
@@ -561,3 +629,35 @@ class TestInlineKeyboard:
         with pytest.raises(PaginationUnchangedError) as exc_info:
             keyboard2.paginate(5, 3, "page_{number}", source="client_b")
         assert exc_info.value.source == "client_b"
+
+    def test_pagination_hashes_evict_least_recently_used_source(
+        self, monkeypatch
+    ):
+        """Test that the hash store evicts the least recently used source."""
+        from pykeyboard import inline_keyboard
+
+        monkeypatch.setattr(inline_keyboard, "_MAX_PAGINATION_SOURCES", 2)
+        InlineKeyboard.clear_pagination_hashes()
+
+        try:
+            InlineKeyboard().paginate(5, 3, "page_{number}", source="lru_a")
+            InlineKeyboard().paginate(5, 3, "page_{number}", source="lru_b")
+
+            # A duplicate hit marks the source as recently used
+            with pytest.raises(PaginationUnchangedError):
+                InlineKeyboard().paginate(5, 3, "page_{number}", source="lru_a")
+
+            InlineKeyboard().paginate(5, 3, "page_{number}", source="lru_c")
+
+            stats = InlineKeyboard.get_pagination_hash_stats()
+            assert stats["sources"] == ["lru_a", "lru_c"]
+
+            # The evicted source no longer reports a duplicate
+            keyboard = InlineKeyboard()
+            keyboard.paginate(5, 3, "page_{number}", source="lru_b")
+            assert keyboard.current_page == 3
+
+            stats = InlineKeyboard.get_pagination_hash_stats()
+            assert stats["sources"] == ["lru_c", "lru_b"]
+        finally:
+            InlineKeyboard.clear_pagination_hashes()
@@ -48,6 +48,18 @@ class TestKeyboardBase:
         assert len(keyboard.keyboard[1]) == 2
         assert len(keyboard.keyboard[2]) == 1
 
+    def test_total_buttons(self):
+        """Test total_buttons counts buttons across rows, including direct edits."""
+        keyboard = KeyboardBase(row_width=2)
+        assert keyboard.total_buttons == 0
+
+        keyboard.add("A", "B", "C")
+        keyboard.row("D")
+        assert keyboard.total_buttons == 4
+
+        keyboard.keyboard.pop()
+        assert keyboard.total_buttons == 3
+
     def test_row_method(self):
         """Test adding buttons row by row."""
         keyboard = KeyboardBase()
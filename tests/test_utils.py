@@ -86,10 +86,9 @@ class TestCreateKeyboardFromConfig:
 class TestGetKeyboardInfo:
     """Test cases for keyboard information retrieval."""
 
-    def test_get_inline_keyboard_info(self):
+    def test_get_inline_keyboard_info(self, inline_keyboard):
         """Test getting information about an inline keyboard."""
-        keyboard = InlineKeyboard()
-        info = get_keyboard_info(keyboard)
+        info = get_keyboard_info(inline_keyboard)
 
         assert info["type"] == "InlineKeyboard"
         assert info["total_buttons"] == 0
@@ -97,35 +96,32 @@ class TestGetKeyboardInfo:
         assert "has_pagination" in info
         assert "custom_locales_count" in info
 
-    def test_get_reply_keyboard_info(self):
+    def test_get_reply_keyboard_info(self, reply_keyboard):
         """Test getting information about a reply keyboard."""
-        keyboard = ReplyKeyboard()
-        keyboard.add("Reply 1", "Reply 2")
-        keyboard.is_persistent = True
-        keyboard.resize_keyboard = True
+        reply_keyboard.add("Reply 1", "Reply 2")
+        reply_keyboard.is_persistent = True
+        reply_keyboard.resize_keyboard = True
 
-        info = get_keyboard_info(keyboard)
+        info = get_keyboard_info(reply_keyboard)
 
         assert info["type"] == "ReplyKeyboard"
         assert info["total_buttons"] == 2
         assert info["is_persistent"] is True
         assert info["resize_keyboard"] is True
 
-    def test_get_keyboard_info_custom_locales_count(self):
+    def test_get_keyboard_info_custom_locales_count(self, inline_keyboard):
         """Test that get_keyboard_info correctly counts custom locales."""
-        keyboard = InlineKeyboard()
-
-        info = get_keyboard_info(keyboard)
+        info = get_keyboard_info(inline_keyboard)
         assert info["custom_locales_count"] == 0
 
-        keyboard.add_custom_locale("custom1", "Custom 1")
-        keyboard.add_custom_locale("custom2", "Custom 2")
+        inline_keyboard.add_custom_locale("custom1", "Custom 1")
+        inline_keyboard.add_custom_locale("custom2", "Custom 2")
 
-        info = get_keyboard_info(keyboard)
+        info = get_keyboard_info(inline_keyboard)
         assert info["custom_locales_count"] == 2
 
-        keyboard.clear_custom_locales()
-        info = get_keyboard_info(keyboard)
+        inline_keyboard.clear_custom_locales()
+        info = get_keyboard_info(inline_keyboard)
         assert info["custom_locales_count"] == 0
 
 
@@ -153,6 +149,11 @@ class TestValidateKeyboardConfig:
         assert len(errors) > 0
         assert any("Invalid keyboard type" in error for error in errors)
 
+    def test_validate_keyboard_type_case_insensitive(self):
+        """Test that validation accepts the same types as create_keyboard_from_config."""
+        assert validate_keyboard_config({"type": "INLINE"}) == []
+        assert validate_keyboard_config({"type": "Reply"}) == []
+
     def test_validate_invalid_row_width(self):
         """Test validation of invalid row width."""
         config = {
@@ -185,3 +186,31 @@ class TestValidateKeyboardConfig:
         errors = validate_keyboard_config({})
 
         assert errors == []
+
+    def test_validate_non_integer_row_width(self):
+        """Test that row_width is not coerced from other types."""
+        errors = validate_keyboard_config({"row_width": "3"})
+
+        assert errors == ["row_width must be a positive integer"]
+        assert validate_keyboard_config({"row_width": 3.0}) == [
+            "row_width must be a positive integer"
+        ]
+
+    def test_validate_bool_row_width(self):
+        """Test that bool row_width is judged as an int, like the model field."""
+        assert validate_keyboard_config({"row_width": True}) == []
+        assert validate_keyboard_config({"row_width": False}) == [
+            "row_width must be a positive integer"
+        ]
+
+    def test_validate_reports_all_errors(self):
+        """Test that every invalid field is reported."""
+        config = {"type": "invalid_type", "row_width": 0, "buttons": "x"}
+
+        errors = validate_keyboard_config(config)
+
+        assert errors == [
+            "Invalid keyboard type: invalid_type",
+            "row_width must be a positive integer",
+            "buttons must be a list",
+        ]